@@ -1,16 +1,29 @@
 import asyncio
 import builtins
+import contextlib
 import datetime
 import functools
-import inspect
 import json
 import logging
+import operator
+import random
 import sys
-from typing import Dict, Iterable, List, Optional, Union
+import time
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import quote
 
 import aiohttp
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .datapoint import DataPoint, Resolution
 from .errors import HTTPException
 from .iterators import AsyncPlayerListIterator, AsyncSessionIterator
@@ -23,35 +36,76 @@ __all__ = ('BattleMetricsClient',)
 
 log = logging.getLogger(__name__)
 
+# Response bodies larger than this are parsed in a thread
+# so long player count histories don't stall the event loop
+_EXECUTOR_PARSE_SIZE = 256 * 1024
+
+
+def _dumps(obj) -> bytes:
+    if orjson is None:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+    return orjson.dumps(obj)
+
+
+def _loads(body: bytes):
+    if orjson is None:
+        return json.loads(body)
+    return orjson.loads(body)
+
 
 async def _json_or_text(response):
-    text = await response.text(encoding='utf-8')
-    if response.headers.get('content-type') == 'application/json':
-        return json.loads(text)
-    return text
+    body = await response.read()
+    # content_type excludes parameters like "; charset=utf-8"
+    if response.content_type == 'application/json':
+        if len(body) < _EXECUTOR_PARSE_SIZE:
+            return _loads(body)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _loads, body)
+    # Error pages from proxies may not be valid text or have an
+    # unknown charset, which shouldn't hide the HTTPException they would cause
+    try:
+        return body.decode(response.charset or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
 
 
-class _MaybeUnlock:
-    def __init__(self, lock: asyncio.Lock):
-        self.lock = lock
-        self._unlock = True
+def _csv_ints(xs: Iterable[int]) -> str:
+    return ','.join(map(str, map(int, xs)))
 
-    async def __aenter__(self):
-        await self.lock.acquire()
-        return self
 
-    def defer(self, unlock_after: Optional[float] = None):
-        self._unlock = False
-        if unlock_after is not None:
-            loop = asyncio.get_running_loop()
-            return loop.call_later(unlock_after, self.lock.release)
+_IDENTIFIER_TYPE_VALUES = {t: t.value for t in IdentifierType}
+_RESOLUTION_VALUES = {r: r.value for r in Resolution}
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._unlock:
-            self.lock.release()
+
+def _parse_datapoints(data: list) -> List[DataPoint]:
+    """Create a list of data points sorted by timestamp."""
+    # Timestamps are all ISO 8601 in UTC so they can be sorted
+    # as strings before creating the data points
+    attributes = [d['attributes'] for d in data]
+    attributes.sort(key=operator.itemgetter('timestamp'))
+    return [DataPoint(a) for a in attributes]
+
+
+async def _gather_limited(func, args: Iterable, concurrency: int) -> list:
+    """Call a coroutine function for each argument concurrently,
+    running at most `concurrency` calls at a time.
+    """
+    concurrency = int(concurrency)
+    if concurrency < 1:
+        raise ValueError('concurrency must be at least 1')
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def run(x):
+        async with sem:
+            return await func(x)
+
+    return await asyncio.gather(*(run(x) for x in args))
 
 
 class _Route:
+    __slots__ = ('path', 'method', 'url')
+
     BASE = 'https://api.battlemetrics.com'
 
     def __init__(self, method, path, **params):
@@ -59,165 +113,398 @@ class _Route:
         self.method = method
         url = self.BASE + path
         if params:
-            url = url.format(**{k: quote(v) if isinstance(v, str) else v for k, v in params.items()})
+            url = self._format_url(url, tuple(params.items()))
         self.url = url
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _format_url(url: str, params: tuple) -> str:
+        # Cached since clients tend to poll the same few resources
+        return url.format_map({k: quote(v) if isinstance(v, str) else v for k, v in params})
 
-def _alias_param(name, alias):
-    """Alias a keyword parameter in a function.
-    Throws a TypeError when a value is given for both the
-    original kwarg and the alias.
-    """
-    MISSING = object()
 
-    def deco(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            alias_value = kwargs.pop(alias, MISSING)
-            if alias_value is not MISSING:
-                if name in kwargs:
-                    raise TypeError(f'Cannot pass both {name!r} and {alias!r} in call')
-                kwargs[name] = alias_value
-            return func(*args, **kwargs)
-        return wrapper
+def _history_params(start, stop, after, before) -> dict:
+    """Build the start and stop parameters for the history endpoints,
+    accepting after and before as aliases for them.
+    Throws a TypeError when a value is given for both a parameter
+    and its alias, or if neither were given.
+    """
+    if after is not None:
+        if start is not None:
+            raise TypeError("Cannot pass both 'start' and 'after' in call")
+        start = after
+    if before is not None:
+        if stop is not None:
+            raise TypeError("Cannot pass both 'stop' and 'before' in call")
+        stop = before
 
-    return deco
+    if start is None:
+        raise TypeError("Missing required argument 'start'")
+    elif stop is None:
+        raise TypeError("Missing required argument 'stop'")
 
+    return {
+        'start': utils.isoify_datetime(start),
+        'stop': utils.isoify_datetime(stop)
+    }
 
-def _get_my_name():
-    """Get the name of the function that called this."""
-    return inspect.stack()[1].function
 
+# Server errors that are worth retrying after a short delay
+_TRANSIENT_STATUSES = frozenset((500, 502, 503, 504))
 
-def _add_bucket(rate, per):
-    """Apply a bucket to check when making an API request."""
-    def deco(func):
-        added_bucket = False
+_BUCKETS: Dict[str, Tuple[int, float]] = {}
+# battlemetrics allows up to 15 requests per second across all endpoints
+_GLOBAL_RATE = (15, 1)
 
-        @functools.wraps(func)
-        def wrapper(self, *args, **kwargs):
-            nonlocal added_bucket
-            if not added_bucket:
-                self._buckets[func.__name__] = Limiter(rate, per)
-                added_bucket = True
 
-            return func(self, *args, **kwargs)
+def _add_bucket(rate, per):
+    """Apply a bucket to check when making an API request.
 
-        return wrapper
+    The bucket is named after the decorated function and is
+    created for each client when it is initialized.
+    """
+    def deco(func):
+        _BUCKETS[func.__name__] = (rate, per)
+        return func
     return deco
 
 
 class BattleMetricsClient:
     """An interface to the battlemetrics API.
 
+    The client can be used as an async context manager, which closes
+    the session on exit if it was created by the client.
+
     Args:
-        session (aiohttp.ClientSession): The session to make requests with.
+        session (Optional[aiohttp.ClientSession]):
+            The session to make requests with. If not provided,
+            a session from `create_session()` is made on the first
+            request. When passing your own session, reuse it across
+            clients so connections can be kept alive between requests.
         token (Optional[str]): An optional authorization token to use when
             making requests.
         sleep_on_ratelimit (bool): Whether ratelimits should be handled by
             sleeping or raising an error.
+        cache_ttl (float): How long in seconds the responses of GET
+            requests are cached for. Concurrent identical requests
+            share a single request while one is in progress.
+            Objects created from a cached response share its payload,
+            so their payloads and dict attributes must not be modified.
+            By default, nothing is cached.
 
     """
+    _CACHE_MAXSIZE = 1024
+
     _Route = _Route
 
     def __init__(
         self,
-        session: aiohttp.ClientSession,
+        session: Optional[aiohttp.ClientSession] = None,
         token: Optional[str] = None,
         *,
-        sleep_on_ratelimit: bool = True
+        sleep_on_ratelimit: bool = True,
+        cache_ttl: float = 0
     ):
         self.session = session
-        self.token = token
+        self._owns_session = session is None
         self.sleep_on_ratelimit = sleep_on_ratelimit
         _user_agent = 'https://github.com/thegamecracks/abattlemetrics ({0}) Python/{1[0]}.{1[1]} aiohttp/{2}'
         self._user_agent = _user_agent.format(__version__, sys.version_info, aiohttp.__version__)
-        self._reqlock = asyncio.Lock()
-        self._buckets = {}
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[tuple, Tuple[float, object]] = {}
+        self._pending: Dict[tuple, asyncio.Future] = {}
+        self.token = token
+        self._buckets = {name: Limiter(*args) for name, args in _BUCKETS.items()}
+        self._locks = {name: asyncio.Lock() for name in _BUCKETS}
+        self._global_bucket = Limiter(*_GLOBAL_RATE)
+        self._global_over = asyncio.Event()
+        self._global_over.set()
+        self._global_timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def token(self) -> Optional[str]:
+        """Optional[str]: The authorization token used in requests."""
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]):
+        self._token = value
+        # Responses cached with the previous token may differ
+        self._cache.clear()
+
+        headers = {
+            'User-Agent': self._user_agent,
+            'Connection': 'keep-alive'
+        }
+        if value:
+            headers['Authorization'] = f'Bearer {value}'
+        self._headers = headers
+        self._json_headers = {**headers, 'Content-Type': 'application/json'}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def cache_clear(self):
+        """Remove every cached response."""
+        self._cache.clear()
+
+    async def close(self):
+        """Close the session if it was created by the client."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    @classmethod
+    def create_session(cls) -> aiohttp.ClientSession:
+        """Create a session with connection pooling tuned for the API.
+
+        This is the session the client creates when none is given.
+        Use it to share one pool of keep-alive connections
+        between multiple clients.
 
-    async def _request(
+        Returns:
+            aiohttp.ClientSession
+
+        """
+        connector = aiohttp.TCPConnector(
+            limit=100, limit_per_host=20,
+            keepalive_timeout=75, ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={'Accept': 'application/json'}
+        )
+
+    def _set_global_ratelimit(self, retry_after: float):
+        # battlemetrics rate limits apply to every endpoint,
+        # so hold off all requests until the limit is over
+        loop = asyncio.get_running_loop()
+        timer = self._global_timer
+        if timer is not None:
+            # Never let a shorter limit cut an ongoing one short
+            if timer.when() >= loop.time() + retry_after:
+                return
+            timer.cancel()
+
+        self._global_over.clear()
+        self._global_timer = loop.call_later(retry_after, self._global_over.set)
+
+    @contextlib.asynccontextmanager
+    async def _response(
             self, route: _Route, *,
             bucket: Optional[str] = None,
             params: Optional[dict] = None,
+            first_try: int = 0,
+            backoff: float = 0.0,
             **kwargs):
-        headers = {
-            'User-Agent': self._user_agent
-        }
-
-        if self.token:
-            headers['Authorization'] = f'Bearer {self.token}'
+        """Make a request and yield the successful response
+        before its body has been read.
 
+        first_try and backoff let a caller that already made
+        an attempt continue the retries where it left off.
+        """
+        headers = self._headers
         if 'json' in kwargs:
-            headers['Content-Type'] = 'application/json'
-            kwargs['data'] = json.dumps(
-                kwargs.pop('json'), separators=(',', ':'), ensure_ascii=True)
+            headers = self._json_headers
+            kwargs['data'] = _dumps(kwargs.pop('json'))
 
         if params is None:
             params = {}
 
+        # Only requests sharing a bucket need to be serialized;
+        # everything else can run concurrently
+        lock = self._locks.get(bucket)
         bucket = self._buckets.get(bucket)
 
-        async with _MaybeUnlock(self._reqlock) as lock:
-            for tries in range(5):
+        if self.session is None:
+            self.session = self.create_session()
+
+        for tries in range(first_try, 5):
+            await self._take_token(self._global_bucket, route)
+
+            if lock is not None:
+                await lock.acquire()
+            unlock = lock is not None
+            try:
+                # The lock only covers this bucket, so waiting for
+                # a token here doesn't hold up any other requests
                 if bucket is not None:
-                    retry_after = bucket.get_retry_after()
-                    if retry_after:
-                        log.debug(
-                            '{0.method} {0.url} locally rate limited for {1:.2f}s'.format(
-                                route, retry_after)
-                        )
-                        await asyncio.sleep(retry_after)
-
-                async with self.session.request(
-                        route.method, route.url,
-                        headers=headers, params=params, **kwargs) as r:
-                    if bucket is not None:
-                        bucket.update_rate_limit()
-
-                    log.debug(f'{route.method} {route.url} returned {r.status}')
-                    data = await _json_or_text(r)
-
-                    retry_after = r.headers.get('Retry-After', 0)
-                    retry_after = float(retry_after)
-                    # NOTE: battlemetrics doesn't always give
-                    # X-Rate-Limit-Remaining header
-                    if retry_after:
-                        if self.sleep_on_ratelimit:
-                            log.warning(f'Rate limited; retrying in {retry_after:.2f}')
-                            await asyncio.sleep(retry_after)
-                            log.debug('Done sleeping for rate limit, retrying...')
-                            continue
-                        else:
-                            e = HTTPException(r, data)
-                            # unlock once rate limit is done
-                            log.warning(
-                                'Rate limited; sleep_on_ratelimit '
-                                'is False, raising exception', exc_info=e
-                            )
-                            lock.defer(retry_after)
-                            raise e
-
-                    if r.status != 200:
-                        e = HTTPException(r, data)
-                        log.exception(
-                            'Response %d caused with:\nRoute: %s %s\nParams: %s',
-                            r.status, route.method, route.path, params, exc_info=e
-                        )
-                        raise e
-
-                    return data
-
-            # No more retries left
-            raise HTTPException(r, data)
-
-    @_alias_param('stop', 'before')
-    @_alias_param('start', 'after')
+                    await self._take_token(bucket, route)
+
+                await self._global_over.wait()
+                r, retry_after = await self._send(route, headers, params, **kwargs)
+                async with r:
+                    if r.status == 200 and not retry_after:
+                        yield r
+                        return
+
+                    if retry_after and unlock:
+                        # unlock once rate limit is done
+                        unlock = False
+                        asyncio.get_running_loop().call_later(retry_after, lock.release)
+                    delay, backoff = await self._check_retry(route, params, r, retry_after, backoff, tries)
+            finally:
+                if unlock:
+                    lock.release()
+
+            # If rate limited, the lock is released by itself once it is over
+            await asyncio.sleep(delay)
+            log.debug('Done sleeping, retrying...')
+
+    async def _send(self, route: _Route, headers: dict, params, **kwargs) -> Tuple[aiohttp.ClientResponse, float]:
+        """Send a request once and return the response
+        along with its Retry-After in seconds.
+        The response must be released by the caller.
+        """
+        r = await self.session.request(route.method, route.url, headers=headers, params=params, **kwargs)
+        log.debug('%s %s returned %d', route.method, route.url, r.status)
+
+        retry_after = r.headers.get('Retry-After')
+        return r, float(retry_after) if retry_after else 0.0
+
+    async def _check_retry(
+            self, route: _Route, params, r, retry_after: float,
+            backoff: float, tries: int) -> Tuple[float, float]:
+        """Raise an HTTPException for an unsuccessful response
+        unless the request should be retried.
+        Rate limits also pause every other request until they are over.
+
+        Returns:
+            Tuple[float, float]: How long to wait before retrying
+                along with the backoff to use for the next retry.
+
+        """
+        data = await _json_or_text(r)
+
+        # NOTE: battlemetrics doesn't always give
+        # X-Rate-Limit-Remaining header
+        if retry_after:
+            self._set_global_ratelimit(retry_after)
+            if not self.sleep_on_ratelimit:
+                e = HTTPException(r, data)
+                log.warning(
+                    'Rate limited; sleep_on_ratelimit '
+                    'is False, raising exception', exc_info=e
+                )
+                raise e
+            elif tries >= 4:
+                # No more retries left
+                raise HTTPException(r, data)
+
+            # Back off exponentially with some jitter so requests
+            # waiting on the same rate limit don't all retry at once
+            backoff = max(retry_after, backoff * 1.5)
+            delay = backoff + random.uniform(0, backoff * 0.25)
+            log.warning('Rate limited; retrying in %.2f', delay)
+        elif r.status not in _TRANSIENT_STATUSES or tries >= 4:
+            e = HTTPException(r, data)
+            log.exception(
+                'Response %d caused with:\nRoute: %s %s\nParams: %s',
+                r.status, route.method, route.path, params, exc_info=e
+            )
+            raise e
+        else:
+            delay = 0.5 * 2 ** tries + random.uniform(0, 0.1)
+            log.warning(
+                'Response %d from %s %s; retrying in %.2f',
+                r.status, route.method, route.path, delay
+            )
+        return delay, backoff
+
+    @staticmethod
+    async def _take_token(bucket: Limiter, route: _Route):
+        """Take a token from a bucket, sleeping until one is available."""
+        while True:
+            retry_after = bucket.acquire()
+            if not retry_after:
+                return
+            log.debug(
+                '%s %s locally rate limited for %.2fs',
+                route.method, route.url, retry_after
+            )
+            await asyncio.sleep(retry_after)
+
+    async def _request(self, route: _Route, *, params=None, **kwargs):
+        if self.cache_ttl and route.method == 'GET' and not kwargs:
+            items = params.items() if isinstance(params, dict) else params or ()
+            try:
+                # The token is part of the key since requests still in
+                # progress may finish after it changes
+                key = (self._token, route.url, frozenset(items))
+            except TypeError:
+                # Parameters with list values aren't hashable
+                pass
+            else:
+                return await self._cached_request(key, route, params)
+
+        return await self._request_uncached(route, params=params, **kwargs)
+
+    async def _cached_request(self, key: tuple, route: _Route, params):
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires, data = entry
+            if expires > time.monotonic():
+                return data
+            del self._cache[key]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_uncached(route, params=params))
+            task.add_done_callback(functools.partial(self._cache_response, key))
+            self._pending[key] = task
+
+        # Shielded so one caller being cancelled doesn't
+        # cancel the request for everyone else waiting on it
+        return await asyncio.shield(task)
+
+    def _cache_response(self, key: tuple, task: asyncio.Future):
+        del self._pending[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        if len(self._cache) >= self._CACHE_MAXSIZE:
+            # Dicts keep insertion order, so this is the oldest entry
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + self.cache_ttl, task.result())
+
+    async def _request_uncached(self, route: _Route, *, params=None, **kwargs):
+        # GETs without a bucket make up most calls, so try them once
+        # directly while no rate limit is in effect and only go
+        # through the retry loop if that fails
+        if (route.method == 'GET' and not kwargs and self.session is not None
+                and self._global_over.is_set()
+                and not self._global_bucket.acquire()):
+            r, retry_after = await self._send(route, self._headers, params)
+            async with r:
+                if r.status == 200 and not retry_after:
+                    return await _json_or_text(r)
+                delay, backoff = await self._check_retry(route, params, r, retry_after, 0.0, 0)
+
+            await asyncio.sleep(delay)
+            log.debug('Done sleeping, retrying...')
+            async with self._response(route, params=params, first_try=1, backoff=backoff) as r:
+                return await _json_or_text(r)
+
+        async with self._response(route, params=params, **kwargs) as r:
+            return await _json_or_text(r)
+
+    async def _stream_datapoints(self, route: _Route, params: dict) -> AsyncIterator[DataPoint]:
+        async with self._response(route, params=params) as r:
+            async for d in ijson.items_async(r.content, 'data.item', use_float=True):
+                yield DataPoint(d['attributes'])
+
     async def get_player_count_history(
         self,
         server_id: int,
         *,
-        start: datetime.datetime, stop: datetime.datetime,
-        resolution: Optional[Resolution] = Resolution.RAW
+        start: Optional[datetime.datetime] = None,
+        stop: Optional[datetime.datetime] = None,
+        resolution: Optional[Resolution] = Resolution.RAW,
+        after: Optional[datetime.datetime] = None,
+        before: Optional[datetime.datetime] = None
     ) -> List[DataPoint]:
         """Obtain a server's player count history.
 
@@ -234,28 +521,59 @@ class BattleMetricsClient:
             resolution (Optional[Resolution]):
                 The resolution of the data points. If raw, the data points
                 will only have value provided. Any other option will provide
-                value, min, and max.
+                value, min, and max. If None, the API's default is used.
 
         Returns:
             List[DataPoint]: A list of data points sorted by timestamp.
 
         """
-        r = _Route('GET', '/servers/{server_id}/player-count-history',
-                   server_id=int(server_id))
+        r, params = self._player_count_history_args(
+            server_id, start, stop, after, before, resolution)
+        payload = await self._request(r, params=params)
+        return _parse_datapoints(payload['data'])
 
-        params = {
-            'start': utils.isoify_datetime(start),
-            'stop': utils.isoify_datetime(stop),
-            'resolution': resolution.value
-        }
+    def get_player_count_history_stream(
+        self,
+        server_id: int,
+        *,
+        start: Optional[datetime.datetime] = None,
+        stop: Optional[datetime.datetime] = None,
+        resolution: Optional[Resolution] = Resolution.RAW,
+        after: Optional[datetime.datetime] = None,
+        before: Optional[datetime.datetime] = None
+    ) -> AsyncIterator[DataPoint]:
+        """Return an async iterator yielding a server's player count
+        history as the response is being parsed.
+
+        This takes the same arguments as `get_player_count_history()`,
+        but avoids loading the entire response into memory at once,
+        which is useful for long periods of history. Unlike
+        `get_player_count_history()`, the data points are yielded
+        in the order that battlemetrics returns them.
+
+        Requires the ijson package to be installed.
 
-        payload = await self._request(r, params=params)
-        data = payload['data']
+        Returns:
+            AsyncIterator[DataPoint]
+
+        """
+        if ijson is None:
+            raise RuntimeError('ijson must be installed to stream data points')
+
+        r, params = self._player_count_history_args(
+            server_id, start, stop, after, before, resolution)
+        return self._stream_datapoints(r, params)
+
+    @staticmethod
+    def _player_count_history_args(server_id, start, stop, after, before, resolution):
+        params = _history_params(start, stop, after, before)
+        r = _Route('GET', '/servers/{server_id}/player-count-history',
+                   server_id=int(server_id))
 
-        datapoints = [DataPoint(d['attributes']) for d in data]
-        datapoints.sort(key=lambda dp: dp.timestamp)
+        if resolution is not None:
+            params['resolution'] = _RESOLUTION_VALUES[resolution]
 
-        return datapoints
+        return r, params
 
     def get_player_session_history(
         self,
@@ -279,7 +597,9 @@ class BattleMetricsClient:
                 filling in the `server` attribute of each Session object.
 
         Returns:
-            AsyncSessionIterator
+            AsyncSessionIterator: Call its `aclose()` method, or use it with
+                `async with`, when stopping before it is exhausted
+                so an upcoming page isn't left requesting.
 
         """
         limit = int(limit)
@@ -290,13 +610,9 @@ class BattleMetricsClient:
 
         params = {}
         if organization_ids:
-            params['filter[organizations]'] = ','.join([
-                str(int(n)) for n in organization_ids
-            ])
+            params['filter[organizations]'] = _csv_ints(organization_ids)
         if server_ids:
-            params['filter[servers]'] = ','.join([
-                str(int(n)) for n in server_ids
-            ])
+            params['filter[servers]'] = _csv_ints(server_ids)
 
         include = []
         if include_servers:
@@ -307,15 +623,15 @@ class BattleMetricsClient:
 
         return AsyncSessionIterator(self, limit, player_id, params)
 
-    @_alias_param('stop', 'before')
-    @_alias_param('start', 'after')
     async def get_player_time_played_history(
         self,
         player_id: int,
         server_id: int,
         *,
-        start: datetime.datetime,
-        stop: datetime.datetime
+        start: Optional[datetime.datetime] = None,
+        stop: Optional[datetime.datetime] = None,
+        after: Optional[datetime.datetime] = None,
+        before: Optional[datetime.datetime] = None
     ) -> List[DataPoint]:
         """Obtain a player's time played history for a server.
 
@@ -338,21 +654,12 @@ class BattleMetricsClient:
                 Each data point is per day and their values are in seconds.
 
         """
+        params = _history_params(start, stop, after, before)
         r = _Route('GET', '/players/{player_id}/time-played-history/{server_id}',
                    player_id=int(player_id), server_id=int(server_id))
 
-        params = {
-            'start': utils.isoify_datetime(start),
-            'stop': utils.isoify_datetime(stop)
-        }
-
         payload = await self._request(r, params=params)
-        data = payload['data']
-
-        datapoints = [DataPoint(d['attributes']) for d in data]
-        datapoints.sort(key=lambda dp: dp.timestamp)
-
-        return datapoints
+        return _parse_datapoints(payload['data'])
 
     def list_players(
         self,
@@ -428,7 +735,9 @@ class BattleMetricsClient:
                 Filter by a list of server IDs.
 
         Returns:
-            AsyncPlayerListIterator
+            AsyncPlayerListIterator: Call its `aclose()` method, or use it with
+                `async with`, when stopping before it is exhausted
+                so an upcoming page isn't left requesting.
 
         """
         limit = int(limit)
@@ -451,10 +760,9 @@ class BattleMetricsClient:
                 # Will result in 500
                 raise ValueError(f'server_ids required for first_seen_{p}')
 
-            params['filter[firstSeen]'] = '{}:{}'.format(
-                utils.isoify_datetime(first_seen_after) if first_seen_after else '',
-                utils.isoify_datetime(first_seen_before) if first_seen_before else ''
-            )
+            after = utils.isoify_datetime(first_seen_after) if first_seen_after else ''
+            before = utils.isoify_datetime(first_seen_before) if first_seen_before else ''
+            params['filter[firstSeen]'] = f'{after}:{before}'
         if game:
             params['filter[server][game]'] = str(game)
 
@@ -484,9 +792,7 @@ class BattleMetricsClient:
         if search:
             params['filter[search]'] = str(search)
         if server_ids:
-            params['filter[servers]'] = ','.join([
-                str(int(n)) for n in server_ids
-            ])
+            params['filter[servers]'] = _csv_ints(server_ids)
 
         return AsyncPlayerListIterator(self, limit, params)
 
@@ -515,38 +821,37 @@ class BattleMetricsClient:
                 Unmatched identifiers are mapped to None.
 
         """
-        def transfer_type(x):
-            return identifier_types[x](x)
-
         if not identifiers:
             raise TypeError('At least 1 identifier must be given')
         elif len(identifiers) > 100:
             raise ValueError('Only 100 identifiers can be requested at once')
 
         r = _Route('POST', '/players/match')
-        data = {
-            'data': [
-                {
-                    'type': 'identifier',
-                    'attributes': {
-                        'type': type.value,
-                        'identifier': str(i)
-                    }
+
+        type_value = _IDENTIFIER_TYPE_VALUES[type]
+        payload_data = []
+        identifier_types = {}
+        results = {}
+        for i in identifiers:
+            i_str = str(i)
+            payload_data.append({
+                'type': 'identifier',
+                'attributes': {
+                    'type': type_value,
+                    'identifier': i_str
                 }
-                for i in identifiers
-            ]
-        }
-        payload = await self._request(r, json=data, bucket=_get_my_name())
+            })
+            identifier_types[i_str] = builtins.type(i)
+            results[i] = None
+
+        payload = await self._request(r, json={'data': payload_data}, bucket='match_players')
         data = payload['data']
         if not data:
             return {}
 
-        identifier_types = {str(i): builtins.type(i) for i in identifiers}
-
-        results = dict.fromkeys(identifiers)
         for d in data:
-            i = transfer_type(d['attributes']['identifier'])
-            results[i] = int(d['relationships']['player']['data']['id'])
+            i = d['attributes']['identifier']
+            results[identifier_types[i](i)] = int(d['relationships']['player']['data']['id'])
         return results
 
     async def get_player_info(self, player_id: int) -> Player:
@@ -563,6 +868,25 @@ class BattleMetricsClient:
         payload = await self._request(r)
         return Player(payload['data'])
 
+    async def get_players_info(
+        self,
+        player_ids: Iterable[int],
+        *,
+        concurrency: int = 10
+    ) -> List[Player]:
+        """Get multiple players' info concurrently.
+
+        Args:
+            player_ids (Iterable[int]): The players' IDs.
+            concurrency (int): The maximum number of requests
+                to make at once.
+
+        Returns:
+            List[Player]: The players in the same order as `player_ids`.
+
+        """
+        return await _gather_limited(self.get_player_info, player_ids, concurrency)
+
     async def get_server_info(
         self,
         server_id: int,
@@ -580,16 +904,36 @@ class BattleMetricsClient:
             Server
 
         """
-        r = _Route('GET', '/servers/{server_id}', server_id=int(server_id))
+        # The query string is part of the path so the cached URL
+        # can be used as is when polling the same server
+        path = '/servers/{server_id}'
+        if include_players:
+            path += '?include=player'
 
-        params = {}
+        r = _Route('GET', path, server_id=int(server_id))
+        return Server(await self._request(r))
 
-        include = []
-        if include_players:
-            include.append('player')
+    async def get_servers_info(
+        self,
+        server_ids: Iterable[int],
+        *,
+        include_players=False,
+        concurrency: int = 10
+    ) -> List[Server]:
+        """Obtain info for multiple servers concurrently.
 
-        include = ','.join(include)
-        if include:
-            params['include'] = include
+        Args:
+            server_ids (Iterable[int]): The servers' IDs.
+            include_players (bool): Whether to also fetch player data.
+                This affects the `players` attribute.
+            concurrency (int): The maximum number of requests
+                to make at once.
 
-        return Server(await self._request(r, params=params))
+        Returns:
+            List[Server]: The servers in the same order as `server_ids`.
+
+        """
+        return await _gather_limited(
+            functools.partial(self.get_server_info, include_players=include_players),
+            server_ids, concurrency
+        )
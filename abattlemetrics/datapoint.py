@@ -1,6 +1,6 @@
 import datetime
 import enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
 from .mixins import PayloadIniter
@@ -34,6 +34,7 @@ class DataPoint(PayloadIniter):
     value (int): The value of the data point.
 
     """
+    __slots__ = ('group', 'min', 'max', 'name', 'value', 'timestamp')
     __init_attrs = ('group', 'min', 'max', 'name', 'value')
 
     group: Optional[int]
@@ -45,15 +46,21 @@ class DataPoint(PayloadIniter):
 
     def __init__(self, payload):
         self.__init_attrs__(payload, self.__init_attrs, required=False)
-        super().__setattr__('timestamp', utils.parse_datetime(payload['timestamp']))
+        object.__setattr__(self, 'timestamp', utils.parse_datetime(payload['timestamp']))
         assert self.value is not None, 'payload is missing "value"'
 
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def __repr__(self):
-        fields = self.__dict__
         return '{}({})'.format(
             self.__class__.__name__,
             ', '.join([
-                f'{name}={value!r}' for name, value in fields.items()
-                if value is not None and not name.startswith('_')
+                f'{name}={value!r}' for name, value in self.__getstate__().items()
+                if value is not None
             ])
         )
@@ -1,6 +1,7 @@
+import asyncio
 import collections
 import logging
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 import urllib.parse as urlparse
 
 from .player import Player
@@ -30,6 +31,13 @@ def _convert_params_to_array(params: dict) -> Union[dict, list]:
     return new
 
 
+def _log_exception(task: asyncio.Future):
+    # A prefetched page may never be awaited if iteration stops early.
+    # Its error is still raised for anyone that does await it
+    if not task.cancelled() and task.exception() is not None:
+        log.debug('Prefetching a page failed', exc_info=task.exception())
+
+
 class AsyncIterator:
     async def flatten(self):
         x = []
@@ -55,14 +63,19 @@ class AsyncPaginatedIterator(AsyncIterator):
         self._route = route
         self._limit = limit
         self._params = params
-        self._current_page = None
+        self._current_page = []
+        self._index = 0
+        self._next_page: Optional[asyncio.Future] = None
+        self._next_page_params: Optional[dict] = None
 
     def _get_next_params(self, r: dict) -> Optional[dict]:
         params = r['links'].get('next')
         if params:
             return urlparse.parse_qs(urlparse.urlparse(params).query)
 
-    async def _request_page(self, params: Union[dict, list]):
+    async def _request_page(self, params: Union[dict, list]) -> Tuple[list, Optional[dict]]:
+        """Request a page and return its items along with the
+        parameters for the next page, if there is one."""
         params = _convert_params_to_array(params)
         res = await self._client._request(self._route, params=params)
         page = await self._parse_response(res)
@@ -75,24 +88,89 @@ class AsyncPaginatedIterator(AsyncIterator):
         if params and self._limit <= 0:
             params = None
 
-        page.reverse()
-        self._current_page = page
-        self._params = params
+        return page, params
+
+    def _prefetch_page(self):
+        """Start requesting the next page in the background
+        so it can arrive while the rest of the current page is consumed."""
+        if self._params is not None:
+            self._params['page[size]'] = min(self._limit, self._MAX_SIZE)
+            self._next_page = asyncio.ensure_future(self._request_page(self._params))
+            self._next_page.add_done_callback(_log_exception)
+            self._next_page_params, self._params = self._params, None
 
     async def _parse_response(self, r: dict) -> List[object]:
         raise NotImplementedError
 
+    async def _wait_for_page(self) -> list:
+        """Wait for the next page, requesting it now if it wasn't prefetched.
+        Returns an empty list once there are no pages left.
+        """
+        if self._next_page is None:
+            self._prefetch_page()
+        if self._next_page is None:
+            return []
+
+        # Shielded so cancelling the caller doesn't lose the page
+        try:
+            page, self._params = await asyncio.shield(self._next_page)
+        except Exception:
+            # Put the page back so the next iteration requests it again
+            self._next_page, self._params = None, self._next_page_params
+            raise
+        self._next_page = None
+        return page
+
+    async def aclose(self):
+        """Stop iterating and cancel the request for the next page
+        if it has already been started.
+
+        Call this when breaking out of the iterator early
+        so the extra request doesn't outlive it. Using the iterator
+        with `async with` calls this on exit.
+        """
+        task, self._next_page = self._next_page, None
+        if task is not None:
+            task.cancel()
+        self._params = None
+        self._current_page, self._index = [], 0
+
+    async def flatten(self):
+        # Extend by whole pages rather than awaiting every item
+        items = self._current_page[self._index:]
+        self._current_page, self._index = [], 0
+
+        page = await self._wait_for_page()
+        while page:
+            # Every item is used, so the next page can start right away
+            self._prefetch_page()
+            items.extend(page)
+            page = await self._wait_for_page()
+        return items
+
     async def next(self):
-        if self._current_page:
-            return self._current_page.pop()
-        elif self._params is not None:
-            self._params['page[size]'] = min(self._limit, self._MAX_SIZE)
-            await self._request_page(self._params)
+        page = self._current_page
+        if self._index >= len(page):
+            page = await self._wait_for_page()
+            self._current_page, self._index = page, 0
+            if not page:
+                raise StopAsyncIteration
+
+        index = self._index
+        item = page[index]
+        self._index = index = index + 1
+
+        # Only prefetch once half the page is consumed, so breaking
+        # out early rarely leaves an extra request behind
+        if self._next_page is None and index * 2 >= len(page):
+            self._prefetch_page()
+        return item
+
+    async def __aenter__(self):
+        return self
 
-        if self._current_page:
-            return self._current_page.pop()
-        else:
-            raise StopAsyncIteration
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
 
 class AsyncPlayerListIterator(AsyncPaginatedIterator):
@@ -102,22 +180,19 @@ class AsyncPlayerListIterator(AsyncPaginatedIterator):
 
     async def _request_page(self, params):
         log.debug('Requesting %d players listed', params['page[size]'])
-        await super()._request_page(params)
+        return await super()._request_page(params)
 
     async def _parse_response(self, r) -> List[Player]:
+        # included is left out when no related resources were requested.
+        # Player IDs are matched as the strings given by the API
+        # since both sides come from the same response
         identifiers = collections.defaultdict(list)
-        for payload in r['included']:
+        for payload in r.get('included', ()):
             if payload['type'] == 'identifier':
-                p_id = int(payload['relationships']['player']['data']['id'])
-                identifiers[p_id].append(payload)
+                identifiers[payload['relationships']['player']['data']['id']].append(payload)
 
-        return [
-            Player(
-                payload,
-                identifiers.get(int(payload['id']), None)
-            )
-            for payload in r['data']
-        ]
+        get_identifiers = identifiers.get
+        return [Player(payload, get_identifiers(payload['id'])) for payload in r['data']]
 
 
 class AsyncSessionIterator(AsyncPaginatedIterator):
@@ -130,12 +205,12 @@ class AsyncSessionIterator(AsyncPaginatedIterator):
 
     async def _request_page(self, params):
         log.debug('Requesting %d sessions', params['page[size]'])
-        await super()._request_page(params)
+        return await super()._request_page(params)
 
     async def _parse_response(self, r) -> List[Session]:
         servers = {
-            payload['attributes']['id']: Server(payload)
-            for payload in r['included']
+            int(payload['id']): Server(payload)
+            for payload in r.get('included', ())
             if payload['type'] == 'server'
         }
 
@@ -143,9 +218,7 @@ class AsyncSessionIterator(AsyncPaginatedIterator):
         for payload in r['data']:
             session = Session(payload)
 
-            server = servers.get(session.server_id)
-            if server is not None:
-                super(Session, session).__setattr__('server', server)
+            object.__setattr__(session, 'server', servers.get(session.server_id))
 
             page.append(session)
 
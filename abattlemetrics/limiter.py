@@ -4,69 +4,57 @@ __all__ = ('Limiter',)
 
 
 class Limiter:
-    """An implementation of the leaky bucket algorithm.
+    """An implementation of the token bucket algorithm.
+
+    Tokens are restored continuously, so the bucket goes from
+    empty to full in `per` seconds.
 
     Args:
         rate (int): The max number of tokens available.
         per (float): How fast the tokens are restored in seconds.
 
     """
-    __slots__ = ('rate', 'per', 'leak_rate', '_last', '_tokens')
+    __slots__ = ('rate', 'per', '_fill_rate', '_last', '_tokens')
 
     def __init__(self, rate, per):
         self.rate = int(rate)
         self.per = float(per)
-        self.leak_rate = self.per / self.rate
+        self._fill_rate = self.rate / self.per
         self._last = 0.0
-        self._tokens = rate
-
-    def get_tokens(self, current=None):
-        current = time.monotonic() if current is None else current
-        last = self._last or current
-
-        tokens = self._tokens
-
-        if current > last + self.per:
-            # Passed window
-            tokens = self.rate
-        else:
-            # Add back any tokens leaked
-            elapsed = current - last
-            tokens += int(elapsed // self.leak_rate)
+        self._tokens = float(self.rate)
 
-        return tokens
-
-    def get_retry_after(self, current=None, *, tokens=None):
+    def get_tokens(self, current=None) -> float:
         current = time.monotonic() if current is None else current
-        last = self._last or current
+        tokens = self._tokens + (current - self._last) * self._fill_rate
+        return min(tokens, self.rate)
 
-        if tokens is None:
-            tokens = self.get_tokens(current)
-        if tokens:
-            return 0
+    def get_retry_after(self, current=None) -> float:
+        tokens = self.get_tokens(current)
+        if tokens >= 1:
+            return 0.0
+        return (1 - tokens) / self._fill_rate
 
-        elapsed = current - last
-        return max(0, self.leak_rate - elapsed)
+    def acquire(self, current=None) -> float:
+        """Take a token from the bucket if one is available.
 
-    def update_rate_limit(self, current=None):
-        current = time.monotonic() if current is None else current
-        if not self._last:
-            self._last = current
+        Returns:
+            float: 0 if a token was taken, otherwise the number
+                of seconds until the next token is available.
 
-        tokens = self.get_tokens(current)
+        """
+        if current is None:
+            current = time.monotonic()
+        # Same as get_tokens(), inlined since this runs for every request
+        tokens = min(self._tokens + (current - self._last) * self._fill_rate, self.rate)
+        self._last = current
 
-        retry_after = 0
-        if tokens:
+        if tokens >= 1:
             self._tokens = tokens - 1
-        else:
-            retry_after = self.get_retry_after(current, tokens=tokens)
-
-        # Only update _last when a token is leaked
-        if current - self._last > self.leak_rate:
-            self._last = current
+            return 0.0
 
-        return retry_after
+        self._tokens = tokens
+        return (1 - tokens) / self._fill_rate
 
     def reset(self):
         self._last = 0.0
-        self._tokens = self.rate
+        self._tokens = float(self.rate)
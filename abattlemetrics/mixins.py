@@ -1,11 +1,106 @@
-from typing import Tuple, Union
+from typing import Callable, Dict, Tuple, Union
+
+_MISSING = object()
+
+# Maps (id(mapping), required) to the mapping and its compiled function.
+# Mappings are class attributes, so there are only a few of them.
+# Each is kept alive by its entry and checked on lookup so that
+# an id reused by another object never matches the wrong entry.
+_compiled: Dict[Tuple[int, bool], Tuple[tuple, Callable]] = {}
+
+
+def _lookup(attrs, path: Tuple[str, ...]):
+    """Walk a path through attrs, raising a KeyError that describes
+    which key was missing."""
+    v = attrs
+    for k in path:
+        try:
+            v = v[k]
+        except (KeyError, TypeError):
+            raise KeyError(f'attrs is missing {k!r} from {v!r}')
+    return v
+
+
+def _compile_mapping(mapping: tuple, required: bool) -> Callable:
+    """Generate a function that extracts the attributes described by
+    a mapping, equivalent to interpreting it in __init_attrs__.
+
+    Mappings are constant for each class, so generating the lookups once
+    avoids parsing the mapping and walking each path in a loop for every
+    instance created.
+
+    """
+    key = (id(mapping), required)
+    compiled = _compiled.get(key)
+    if compiled is not None and compiled[0] is mapping:
+        return compiled[1]
+
+    namespace = {'KeyError': KeyError, 'TypeError': TypeError,
+                 'lookup': _lookup, 'setattr_': object.__setattr__}
+    lines = ['def init(self, attrs):']
+    for i, x in enumerate(mapping):
+        if isinstance(x, str):
+            name, path, conv = x, (x,), None
+            default = default_factory = _MISSING
+        else:
+            name, path = x['name'], x.get('path')
+            if path is None:
+                path = name
+            if isinstance(path, str):
+                path = (path,)
+            conv = x.get('type')
+            default = x.get('default', _MISSING)
+            default_factory = x.get('default_factory', _MISSING)
+
+        namespace[f'path_{i}'] = tuple(path)
+        lines.append('    try:')
+        lines.append('        v = attrs' + ''.join(f'[{k!r}]' for k in path))
+        lines.append('    except (KeyError, TypeError):')
+        if not required:
+            lines.append('        v = None')
+        elif default is not _MISSING:
+            namespace[f'default_{i}'] = default
+            lines.append(f'        v = default_{i}')
+        elif default_factory is not _MISSING:
+            namespace[f'default_factory_{i}'] = default_factory
+            lines.append(f'        v = default_factory_{i}()')
+        else:
+            lines.append(f'        v = lookup(attrs, path_{i})')
+        if conv is not None:
+            namespace[f'conv_{i}'] = conv
+            lines.append(f'    v = conv_{i}(v)')
+        lines.append(f'    setattr_(self, {name!r}, v)')
+
+    exec('\n'.join(lines), namespace)
+    func = namespace['init']
+    _compiled[key] = (mapping, func)
+    return func
 
 
 class PayloadIniter:
     """Provides an __init_attrs__ method for extracting attributes
     from a payload. Use __init_attrs to specify the attributes.
 
+    Attributes that are expensive to convert can be listed in
+    _lazy_attrs, mapping each name to the attribute holding its raw
+    value and a converter. These are converted on first access.
+
     """
+    __slots__ = ()
+
+    _lazy_attrs: Dict[str, Tuple[str, Callable]] = {}
+
+    def __getattr__(self, name):
+        # Only called for attributes that haven't been assigned yet
+        lazy = self._lazy_attrs.get(name)
+        if lazy is None:
+            raise AttributeError(
+                f'{self.__class__.__name__!r} object has no attribute {name!r}')
+
+        raw_name, conv = lazy
+        value = conv(getattr(self, raw_name))
+        object.__setattr__(self, name, value)
+        return value
 
     def __init_attrs__(
             self, attrs, mapping: Tuple[Union[str, dict], ...], *,
@@ -51,41 +146,4 @@ class PayloadIniter:
         Raises:
             KeyError: An attribute specified in mapping was missing from attrs.
         """
-        def lookup(p):
-            v = attrs
-            for k in p:
-                try:
-                    v = v[k]
-                except (KeyError, TypeError):
-                    if required:
-                        raise KeyError(f'attrs is missing {k!r} from {v!r}')
-                    return
-            return v
-
-        missing = object()
-
-        for x in mapping:
-            if isinstance(x, str):
-                super().__setattr__(x, lookup((x,)))
-            else:
-                name, path = x['name'], x.get('path')
-                if path is None:
-                    path = name
-                if isinstance(path, str):
-                    path = (path,)
-
-                try:
-                    val = lookup(path)
-                except KeyError as e:
-                    val = x.get('default', missing)
-                    if val is missing:
-                        val = x.get('default_factory', missing)
-                        if val is missing:
-                            raise e
-                        val = val()
-
-                conv = x.get('type')
-                if conv is not None:
-                    val = conv(val)
-
-                super().__setattr__(x['name'], val)
+        _compile_mapping(mapping, required)(self, attrs)
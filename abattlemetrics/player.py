@@ -9,6 +9,9 @@ from . import utils
 
 __all__ = ('IdentifierType', 'Identifier', 'Player')
 
+# Most identifiers have no metadata, so they can share one empty view
+_EMPTY_METADATA = types.MappingProxyType({})
+
 
 class IdentifierType(enum.Enum):
     """A player identifier type."""
@@ -29,6 +32,19 @@ class IdentifierType(enum.Enum):
         return '<{0.__class__.__name__}.{0.name}>'.format(self)
 
 
+# Looking up members directly skips the overhead of calling the enum
+_IDENTIFIER_TYPES = {t.value: t for t in IdentifierType}
+
+
+def _identifier_type(value: str) -> IdentifierType:
+    member = _IDENTIFIER_TYPES.get(value)
+    if member is None:
+        # Raises the usual ValueError for types not known yet
+        member = IdentifierType(value)
+    return member
+
+
+@utils.add_slots
 @dataclass(frozen=True, init=False)
 class Identifier(PayloadIniter):
     """A player identifier.
@@ -57,27 +73,34 @@ class Identifier(PayloadIniter):
         {'name': 'player_id', 'type': int,
          'path': ('relationships', 'player', 'data', 'id')},
         {'name': 'private', 'path': ('attributes', 'private')},
-        {'name': 'type', 'path': ('attributes', 'type'), 'type': IdentifierType}
+        {'name': 'type', 'path': ('attributes', 'type'),
+         'type': _identifier_type}
     )
 
     id: int
     last_seen: datetime.datetime  = field(hash=False, repr=False)
     metadata: dict                = field(hash=False, repr=False)
     name: str                     = field(hash=False)
-    payload: dict                 = field(hash=False, repr=False)
+    _payload: dict                = field(repr=False, compare=False)
     player_id: int                = field(hash=False, repr=False)
     private: bool                 = field(hash=False, repr=False)
     type: IdentifierType          = field(hash=False, repr=False)
 
     def __init__(self, payload):
-        super().__setattr__('payload', types.MappingProxyType(payload))
+        object.__setattr__(self, '_payload', payload)
 
         self.__init_attrs__(payload, self.__init_attrs)
 
-        metadata = payload['attributes']['metadata'] or {}
-        super().__setattr__('metadata', types.MappingProxyType(metadata))
+        metadata = payload['attributes']['metadata']
+        metadata = types.MappingProxyType(metadata) if metadata else _EMPTY_METADATA
+        object.__setattr__(self, 'metadata', metadata)
 
+    @property
+    def payload(self) -> dict:
+        return types.MappingProxyType(self._payload)
 
+
+@utils.add_slots
 @dataclass(frozen=True, init=False)
 class Player(PayloadIniter):
     """Represents a player.
@@ -107,42 +130,64 @@ class Player(PayloadIniter):
 
     """
     __init_attrs = (
-        {'name': 'created_at', 'type': utils.parse_datetime,
-         'path': ('attributes', 'createdAt')},
+        {'name': '_created_at', 'path': ('attributes', 'createdAt')},
         {'name': 'id', 'type': int},
         {'name': 'name', 'path': ('attributes', 'name')},
         {'name': 'private', 'path': ('attributes', 'private')},
         {'name': 'positive_match', 'path': ('attributes', 'positiveMatch')},
-        {'name': 'updated_at', 'type': utils.parse_datetime,
-         'path': ('attributes', 'updatedAt')}
+        {'name': '_updated_at', 'path': ('attributes', 'updatedAt')}
     )
-    _init_meta = ({'name': 'first_time', 'path': 'firstTime'},
-                  'score', {'name': 'playtime', 'path': 'time'})
+    _lazy_attrs = {
+        'created_at': ('_created_at', utils.parse_datetime),
+        'updated_at': ('_updated_at', utils.parse_datetime)
+    }
 
     created_at: datetime.datetime       = field(hash=False, repr=False)
+    _created_at: str                    = field(repr=False, compare=False)
     first_time: Optional[bool]          = field(hash=False, repr=False)
     id: int
     identifiers: Tuple[Identifier, ...] = field(hash=False, repr=False)
     name: str                           = field(hash=False)
     score: Optional[int]                = field(hash=False, repr=False)
-    payload: dict                       = field(hash=False, repr=False)
+    _payload: dict                      = field(repr=False, compare=False)
     playtime: Optional[float]           = field(hash=False, repr=False)
     positive_match: bool                = field(hash=False, repr=False)
     private: bool                       = field(hash=False, repr=False)
     updated_at: datetime.datetime       = field(hash=False, repr=False)
+    _updated_at: str                    = field(repr=False, compare=False)
 
     def __init__(self, payload, identifiers=None):
-        def flatten_meta(metadata):
-            return {x['key']: x['value'] for x in metadata}
-
-        super().__setattr__('payload', types.MappingProxyType(payload))
+        object.__setattr__(self, '_payload', payload)
 
         self.__init_attrs__(payload, self.__init_attrs)
-        metadata = flatten_meta(payload.get('meta', {}).get('metadata', {}))
-        self.__init_attrs__(metadata, self._init_meta, required=False)
+
+        # Metadata is a list of key-value entries, scanned directly
+        # for the few keys needed rather than flattened into a dict
+        try:
+            metadata = payload['meta']['metadata']
+        except KeyError:
+            metadata = ()
+
+        first_time = score = playtime = None
+        for entry in metadata:
+            key = entry['key']
+            if key == 'score':
+                score = entry['value']
+            elif key == 'time':
+                playtime = entry['value']
+            elif key == 'firstTime':
+                first_time = entry['value']
+
+        object.__setattr__(self, 'first_time', first_time)
+        object.__setattr__(self, 'score', score)
+        object.__setattr__(self, 'playtime', playtime)
 
         if identifiers:
-            identifiers = tuple(Identifier(p) for p in identifiers)
+            identifiers = tuple([Identifier(p) for p in identifiers])
         else:
             identifiers = ()
-        super().__setattr__('identifiers', identifiers)
+        object.__setattr__(self, 'identifiers', identifiers)
+
+    @property
+    def payload(self) -> dict:
+        return types.MappingProxyType(self._payload)
@@ -10,6 +10,7 @@ from . import utils
 __all__ = ('Server',)
 
 
+@utils.add_slots
 @dataclass(frozen=True, init=False)
 class Server(PayloadIniter):
     """Represents a server returned by get_server_info().
@@ -39,26 +40,29 @@ class Server(PayloadIniter):
 
     """
     __init_attrs = (
-        {'name': 'created_at', 'type': utils.parse_datetime,
-         'path': 'createdAt'},
+        {'name': '_created_at', 'path': 'createdAt'},
         'address', 'country', 'details', {'name': 'id', 'type': int}, 'ip',
         {'name': 'max_players', 'path': 'maxPlayers'}, 'name',
         {'name': 'player_count', 'path': 'players'}, 'port',
         {'name': 'query_port', 'path': 'portQuery'}, 'private',
         'rank', 'status',
-        {'name': 'updated_at', 'type': utils.parse_datetime,
-         'path': 'updatedAt'}
+        {'name': '_updated_at', 'path': 'updatedAt'}
     )
+    _lazy_attrs = {
+        'created_at': ('_created_at', utils.parse_datetime),
+        'updated_at': ('_updated_at', utils.parse_datetime)
+    }
 
     address: Optional[str]        = field(hash=False, repr=False)
     country: str                  = field(hash=False, repr=False)
     created_at: datetime.datetime = field(hash=False, repr=False)
+    _created_at: str              = field(repr=False, compare=False)
     details: dict                 = field(hash=False, repr=False)
     id: int
     ip: str                       = field(hash=False, repr=False)
     max_players: int              = field(hash=False, repr=False)
     name: str                     = field(hash=False)
-    payload: dict                 = field(hash=False, repr=False)
+    _payload: dict                = field(repr=False, compare=False)
     player_count: int             = field(hash=False, repr=False)
     players: Tuple[Player]        = field(hash=False, repr=False)
     port: int                     = field(hash=False, repr=False)
@@ -67,9 +71,10 @@ class Server(PayloadIniter):
     rank: int                     = field(hash=False, repr=False)
     status: str                   = field(hash=False, repr=False)
     updated_at: datetime.datetime = field(hash=False, repr=False)
+    _updated_at: str              = field(repr=False, compare=False)
 
     def __init__(self, payload):
-        super().__setattr__('payload', types.MappingProxyType(payload))
+        object.__setattr__(self, '_payload', payload)
 
         data = payload.get('data')
         if data:
@@ -82,8 +87,12 @@ class Server(PayloadIniter):
         included = payload.get('included')
         players = ()
         if included:
-            players = tuple(
+            players = tuple([
                 Player(item) for item in included
                 if item['type'] == 'player'
-            )
-        super().__setattr__('players', players)
+            ])
+        object.__setattr__(self, 'players', players)
+
+    @property
+    def payload(self) -> dict:
+        return types.MappingProxyType(self._payload)
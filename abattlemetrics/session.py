@@ -1,6 +1,5 @@
 from dataclasses import dataclass, field
 import datetime
-import functools
 import types
 from typing import Optional
 
@@ -17,6 +16,7 @@ def _parse_optional_datetime(date_string: Optional[str]):
     return utils.parse_datetime(date_string)
 
 
+@utils.add_slots
 @dataclass(frozen=True, init=False)
 class Session(PayloadIniter):
     """Represents a player session.
@@ -58,22 +58,27 @@ class Session(PayloadIniter):
 
     first_time: bool                   = field(hash=False, repr=False)
     id: str
-    payload: dict                      = field(hash=False, repr=False)
+    _payload: dict                     = field(repr=False, compare=False)
     player_id: int                     = field(hash=False)
     player_name: str                   = field(hash=False, repr=False)
+    playtime: float                    = field(hash=False, repr=False)
     server: Optional[Server]           = field(hash=False, repr=False)
     server_id: int                     = field(hash=False)
     start: Optional[datetime.datetime] = field(hash=False, repr=False)
     stop: Optional[datetime.datetime]  = field(hash=False, repr=False)
 
     def __init__(self, payload):
-        super().__setattr__('payload', types.MappingProxyType(payload))
-        # NOTE: server is manually assigned by AsyncSessionIterator
+        object.__setattr__(self, '_payload', payload)
+        # NOTE: server is replaced by AsyncSessionIterator
+        object.__setattr__(self, 'server', None)
 
         self.__init_attrs__(payload, self.__init_attrs)
 
-    @functools.cached_property
-    def playtime(self) -> float:
-        if self.start is None or self.stop is None:
-            return 0
-        return (self.stop - self.start).total_seconds()
+        playtime = 0
+        if self.start is not None and self.stop is not None:
+            playtime = (self.stop - self.start).total_seconds()
+        object.__setattr__(self, 'playtime', playtime)
+
+    @property
+    def payload(self) -> dict:
+        return types.MappingProxyType(self._payload)
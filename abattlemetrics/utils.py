@@ -1,6 +1,67 @@
+import dataclasses
 import datetime
+import functools
+import re
+import types
 
-import dateutil.parser
+# Python versions before 3.11 only accept 3 or 6 fractional digits
+_FRACTION = re.compile(r'\.(\d+)')
+
+
+def _dataclass_getstate(self):
+    state = [getattr(self, f.name) for f in dataclasses.fields(self)]
+    # Read-only views can't be pickled, so they are saved
+    # as a copy of their mapping and recreated afterwards
+    views = tuple(i for i, v in enumerate(state) if isinstance(v, types.MappingProxyType))
+    for i in views:
+        state[i] = state[i].copy()
+    return state, views
+
+
+def _dataclass_setstate(self, state):
+    state, views = state
+    for i in views:
+        state[i] = types.MappingProxyType(state[i])
+    for f, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+def _frozen_setattr(self, name, value):
+    raise dataclasses.FrozenInstanceError(f'cannot assign to field {name!r}')
+
+
+def _frozen_delattr(self, name):
+    raise dataclasses.FrozenInstanceError(f'cannot delete field {name!r}')
+
+
+def add_slots(cls):
+    """Recreate a dataclass with __slots__ for each of its fields.
+
+    This backports dataclass(slots=True) from Python 3.10. Fields declared
+    with field() can't be listed in __slots__ directly since their defaults
+    conflict with the slot descriptors, so the class is rebuilt afterwards.
+    Methods of the class must not use the zero-argument form of super().
+    """
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = names
+    # Frozen dataclasses can't be copied or pickled through setattr,
+    # and slotted classes have no __dict__ to restore the state into
+    cls_dict.setdefault('__getstate__', _dataclass_getstate)
+    cls_dict.setdefault('__setstate__', _dataclass_setstate)
+    if cls.__dataclass_params__.frozen:
+        # The generated methods refer to the original class
+        # and fail with a TypeError on the rebuilt one
+        cls_dict['__setattr__'] = _frozen_setattr
+        cls_dict['__delattr__'] = _frozen_delattr
+    for name in names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
 
 
 def isoify_datetime(dt: datetime.datetime) -> str:
@@ -10,9 +71,19 @@ def isoify_datetime(dt: datetime.datetime) -> str:
     return dt.replace(microsecond=0, tzinfo=None).isoformat() + 'Z'
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_datetime(date_string: str) -> datetime.datetime:
     """Parse a datetime given by battlemetrics."""
-    dt = dateutil.parser.isoparse(date_string)
+    # fromisoformat only accepts a trailing Z since Python 3.11
+    if date_string.endswith('Z'):
+        date_string = date_string[:-1] + '+00:00'
+
+    try:
+        dt = datetime.datetime.fromisoformat(date_string)
+    except ValueError:
+        dt = datetime.datetime.fromisoformat(_FRACTION.sub(
+            lambda m: '.' + m[1][:6].ljust(6, '0'), date_string, count=1))
+
     if dt.tzinfo:
         return dt.astimezone(datetime.timezone.utc)
     return dt.replace(tzinfo=datetime.timezone.utc)
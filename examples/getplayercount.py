@@ -4,7 +4,6 @@ import logging
 from pprint import pprint
 
 import abattlemetrics as abm
-import aiohttp
 
 SERVER_ID = 1234
 
@@ -16,8 +15,7 @@ log.addHandler(handler)
 
 
 async def main():
-    async with aiohttp.ClientSession() as session:
-        client = abm.BattleMetricsClient(session)
+    async with abm.BattleMetricsClient() as client:
         # Get the player count history in the last hour
         stop = datetime.datetime.now()
         start = stop - datetime.timedelta(hours=1)
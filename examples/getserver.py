@@ -2,7 +2,6 @@ import asyncio
 import logging
 
 import abattlemetrics as abm
-import aiohttp
 
 SERVER_ID = 1234
 
@@ -14,8 +13,7 @@ log.addHandler(handler)
 
 
 async def main():
-    async with aiohttp.ClientSession() as session:
-        client = abm.BattleMetricsClient(session)
+    async with abm.BattleMetricsClient() as client:
         server = await client.get_server_info(SERVER_ID, include_players=True)
         print(server)
 
@@ -2,7 +2,6 @@ import asyncio
 import logging
 
 import abattlemetrics as abm
-import aiohttp
 
 TOKEN = '<Your token here>'
 PLAYER_ID = 1234
@@ -16,8 +15,7 @@ log.addHandler(handler)
 
 
 async def main():
-    async with aiohttp.ClientSession() as session:
-        client = abm.BattleMetricsClient(session, TOKEN)
+    async with abm.BattleMetricsClient(token=TOKEN) as client:
         results = await client.match_players(PLAYER_ID, type=PLAYER_ID_TYPE)
         bm_id = results[PLAYER_ID]
         if bm_id is not None:
@@ -2,7 +2,6 @@ import asyncio
 import logging
 
 import abattlemetrics as abm
-import aiohttp
 
 TOKEN = None
 
@@ -14,8 +13,7 @@ log.addHandler(handler)
 
 
 async def main():
-    async with aiohttp.ClientSession() as session:
-        client = abm.BattleMetricsClient(session, TOKEN)
+    async with abm.BattleMetricsClient(token=TOKEN) as client:
         # Get 5 random players currently online
         async for p in client.list_players(limit=5, is_online=True):
             print(p)
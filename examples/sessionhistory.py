@@ -2,7 +2,6 @@ import asyncio
 import logging
 
 import abattlemetrics as abm
-import aiohttp
 
 PLAYER_ID = 1234
 
@@ -14,8 +13,7 @@ log.addHandler(handler)
 
 
 async def main():
-    async with aiohttp.ClientSession() as session:
-        client = abm.BattleMetricsClient(session)
+    async with abm.BattleMetricsClient() as client:
         async for s in client.get_player_session_history(PLAYER_ID, limit=1):
             print(s)
 
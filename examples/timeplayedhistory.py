@@ -4,7 +4,6 @@ import logging
 from pprint import pprint
 
 import abattlemetrics as abm
-import aiohttp
 
 PLAYER_ID = 1234
 SERVER_ID = 1234
@@ -17,8 +16,7 @@ log.addHandler(handler)
 
 
 async def main():
-    async with aiohttp.ClientSession() as session:
-        client = abm.BattleMetricsClient(session)
+    async with abm.BattleMetricsClient() as client:
         # Get the time played history in the last week
         stop = datetime.datetime.now()
         start = stop - datetime.timedelta(weeks=1)
@@ -0,0 +1,109 @@
+import copy
+import dataclasses
+import pickle
+import unittest
+
+import abattlemetrics as abm
+
+
+def _identifier_payload(id_, player_id):
+    return {
+        'type': 'identifier', 'id': str(id_),
+        'attributes': {
+            'type': 'steamID', 'identifier': '76561197960287930',
+            'lastSeen': '2021-01-03T00:00:00.000Z',
+            'private': False, 'metadata': None
+        },
+        'relationships': {'player': {'data': {'type': 'player', 'id': str(player_id)}}}
+    }
+
+
+def _player_payload(id_):
+    return {
+        'type': 'player', 'id': str(id_),
+        'attributes': {
+            'id': str(id_), 'name': f'Player {id_}', 'private': False,
+            'positiveMatch': False,
+            'createdAt': '2021-01-01T00:00:00.000Z',
+            'updatedAt': '2021-01-02T00:00:00.000Z'
+        },
+        'meta': {'metadata': [{'key': 'score', 'value': 5}]},
+        'relationships': {}
+    }
+
+
+def _server_payload(id_):
+    return {
+        'data': {
+            'type': 'server', 'id': str(id_),
+            'attributes': {
+                'id': str(id_), 'name': 'Server', 'address': None,
+                'ip': '127.0.0.1', 'port': 2302, 'portQuery': 2303,
+                'players': 1, 'maxPlayers': 10, 'rank': 1, 'country': 'US',
+                'status': 'online', 'details': {}, 'private': False,
+                'createdAt': '2020-01-01T00:00:00.000Z',
+                'updatedAt': '2020-01-02T00:00:00.000Z'
+            }
+        },
+        'included': [_player_payload(1)]
+    }
+
+
+def _session_payload(id_):
+    return {
+        'type': 'session', 'id': str(id_),
+        'attributes': {
+            'firstTime': False, 'name': 'Player 1',
+            'start': '2021-01-01T00:00:00.000Z',
+            'stop': '2021-01-01T01:00:00.000Z'
+        },
+        'relationships': {
+            'player': {'data': {'type': 'player', 'id': '1'}},
+            'server': {'data': {'type': 'server', 'id': '3'}}
+        }
+    }
+
+
+class TestModelCopying(unittest.TestCase):
+    def setUp(self):
+        self.models = (
+            abm.Identifier(_identifier_payload(2, 1)),
+            abm.Player(_player_payload(1), [_identifier_payload(2, 1)]),
+            abm.Server(_server_payload(3)),
+            abm.Session(_session_payload(4)),
+        )
+
+    def assertSameModel(self, model, other):
+        self.assertIsNot(model, other)
+        self.assertEqual(model, other)
+        self.assertEqual(model.payload, other.payload)
+
+    def test_copy(self):
+        for model in self.models:
+            with self.subTest(model=model):
+                self.assertSameModel(model, copy.copy(model))
+                self.assertSameModel(model, copy.deepcopy(model))
+
+    def test_pickle(self):
+        for model in self.models:
+            with self.subTest(model=model):
+                self.assertSameModel(model, pickle.loads(pickle.dumps(model)))
+
+    def test_frozen(self):
+        for model in self.models:
+            with self.subTest(model=model):
+                with self.assertRaises(dataclasses.FrozenInstanceError):
+                    model.id = 0
+                with self.assertRaises(dataclasses.FrozenInstanceError):
+                    model.foo = 1
+                with self.assertRaises(dataclasses.FrozenInstanceError):
+                    del model.id
+
+    def test_lazy_attributes_survive_copy(self):
+        player = copy.copy(self.models[1])
+        self.assertEqual(player.created_at.year, 2021)
+        self.assertEqual(player.identifiers[0].type, abm.IdentifierType.STEAM_ID)
+
+
+if __name__ == '__main__':
+    unittest.main()